@@ -0,0 +1,72 @@
+import asyncio
+import time
+from logging.config import fileConfig
+
+from sqlalchemy import pool, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alembic import context
+
+from models import Base, DATABASE_URL, make_async_url
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Generuje SQL migracji bez połączenia z bazą (`alembic upgrade head --sql`)."""
+    context.configure(
+        url=make_async_url(DATABASE_URL).render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+# Każda instancja odpala migracje przy starcie (startup.sh) - lock sesyjny puszcza jedną naraz,
+# pozostałe po jego zwolnieniu widzą już head i nic nie robią
+MIGRATION_LOCK_ID = 7240001
+
+
+def acquire_migration_lock(connection: Connection) -> None:
+    # pg_try_advisory_lock w pętli zamiast blokującego pg_advisory_lock: czekająca transakcja
+    # zablokowałaby CREATE INDEX CONCURRENTLY trwającej migracji (deadlock)
+    while not connection.execute(text("SELECT pg_try_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID}).scalar():
+        connection.rollback()
+        time.sleep(1)
+    connection.commit()  # lock sesyjny przeżywa commit; zwalnia go zamknięcie połączenia
+
+
+def do_run_migrations(connection: Connection) -> None:
+    acquire_migration_lock(connection)
+    context.configure(connection=connection, target_metadata=target_metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    connectable = create_async_engine(make_async_url(DATABASE_URL), poolclass=pool.NullPool)
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,107 @@
+"""schemat bazowy (dotychczas tworzony przez Base.metadata.create_all)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# Istniejące bazy mają już te tabele z create_all, stąd if_not_exists
+def upgrade() -> None:
+    op.create_table(
+        "manager_user",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String()),
+        sa.Column("password_hash", sa.String()),
+        sa.Column("role", sa.String()),
+        if_not_exists=True,
+    )
+    op.create_index("ix_manager_user_id", "manager_user", ["id"], if_not_exists=True)
+    op.create_index("ix_manager_user_username", "manager_user", ["username"], unique=True, if_not_exists=True)
+
+    op.create_table(
+        "menu_category",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name_pl", sa.String()),
+        sa.Column("name_en", sa.String()),
+        sa.Column("image_url", sa.String(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_menu_category_id", "menu_category", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "menu_item",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("category_id", sa.Integer(), sa.ForeignKey("menu_category.id")),
+        sa.Column("name_pl", sa.String()),
+        sa.Column("name_en", sa.String()),
+        sa.Column("price_cents", sa.Integer()),
+        sa.Column("image_url", sa.String(), nullable=True),
+        sa.Column("is_available", sa.Boolean()),
+        sa.Column("ingredients", sa.String(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_menu_item_id", "menu_item", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "orders",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("order_number", sa.Integer()),
+        sa.Column("status", sa.String()),
+        sa.Column("type", sa.String()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("ready_at", sa.DateTime(), nullable=True),
+        sa.Column("language", sa.String()),
+        if_not_exists=True,
+    )
+    op.create_index("ix_orders_id", "orders", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "order_item",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("order_id", sa.Integer(), sa.ForeignKey("orders.id")),
+        sa.Column("menu_item_id", sa.Integer(), sa.ForeignKey("menu_item.id")),
+        sa.Column("quantity", sa.Integer()),
+        if_not_exists=True,
+    )
+    op.create_index("ix_order_item_id", "order_item", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "order_event_log",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("order_id", sa.Integer(), sa.ForeignKey("orders.id")),
+        sa.Column("event_type", sa.String()),
+        sa.Column("terminal_name", sa.String()),
+        sa.Column("timestamp", sa.DateTime()),
+        sa.Column("new_status", sa.String()),
+        if_not_exists=True,
+    )
+    op.create_index("ix_order_event_log_id", "order_event_log", ["id"], if_not_exists=True)
+
+    op.create_table(
+        "payments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("hostname", sa.String()),
+        sa.Column("order_number", sa.Integer()),
+        sa.Column("amount_cents", sa.Integer()),
+        sa.Column("status", sa.String()),
+        sa.Column("terminal_log", sa.String(), nullable=True),
+        sa.Column("description", sa.String(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_payments_id", "payments", ["id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    for table in ("payments", "order_event_log", "order_item", "orders", "menu_item", "menu_category", "manager_user"):
+        op.drop_table(table)
@@ -0,0 +1,27 @@
+"""indeksy pod /stats/menu-items/top
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+# CONCURRENTLY nie blokuje zapisów do tabel, ale nie może działać w transakcji
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("idx_orderitem_menu", "order_item", ["menu_item_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("idx_orders_created_at", "orders", ["created_at"], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("idx_orders_created_at", table_name="orders", postgresql_concurrently=True)
+        op.drop_index("idx_orderitem_menu", table_name="order_item", postgresql_concurrently=True)
@@ -0,0 +1,97 @@
+"""widok zmaterializowany mv_orders_daily pod /stats/orders/daily
+
+Odświeżanie co 5 min przez pg_cron. Rozszerzenie działa tylko w bazie cron.database_name
+(domyślnie postgres, także na Azure), więc job jest zakładany stamtąd przez
+cron.schedule_in_database. Bez pg_cron migracja się zatrzymuje - chyba że MV_REFRESH_EXTERNAL=1,
+wtedy `REFRESH MATERIALIZED VIEW CONCURRENTLY mv_orders_daily` co kilka minut musi wykonywać
+zewnętrzny harmonogram (inaczej każdy kolejny dzień liczy się w całości zapytaniem na żywo).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-14
+
+"""
+import os
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+REFRESH_JOB = "refresh_mv_orders_daily"
+REFRESH_SQL = "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_orders_daily"
+MV_REFRESH_EXTERNAL = os.getenv("MV_REFRESH_EXTERNAL") == "1"
+
+
+def cron_database():
+    """Nazwa bazy z pg_cron albo None, gdy pg_cron nie jest w shared_preload_libraries."""
+    return op.get_bind().execute(sa.text("SELECT current_setting('cron.database_name', true)")).scalar()
+
+
+def execute_in_cron_database(cron_db: str, sql: str, params: dict):
+    # osobne połączenie do cron.database_name tym samym kontem; sync_engine działa w greenlecie env.py
+    engine = create_async_engine(op.get_bind().engine.url.set(database=cron_db), poolclass=NullPool).sync_engine
+    try:
+        with engine.begin() as conn:
+            if not conn.execute(sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_cron'")).first():
+                raise RuntimeError(f"pg_cron is loaded but not created in database {cron_db!r}: run CREATE EXTENSION pg_cron there")
+            conn.execute(sa.text(sql), params)
+    finally:
+        engine.dispose()
+
+
+def upgrade() -> None:
+    # last_event_at = znacznik czasu odświeżenia; endpoint dolicza na żywo tylko nowsze zdarzenia
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_orders_daily AS
+        SELECT terminal_name,
+               date_trunc('day', timestamp) AS day,
+               count(*) AS orders_count,
+               max(timestamp) AS last_event_at
+        FROM order_event_log
+        WHERE event_type = 'ready'
+        GROUP BY 1, 2
+    """)
+    # REFRESH ... CONCURRENTLY wymaga indeksu unikalnego
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_orders_daily ON mv_orders_daily (terminal_name, day)")
+
+    if MV_REFRESH_EXTERNAL:
+        return
+    if op.get_context().as_sql:
+        # skrypt offline działa w bazie aplikacji, a job zakłada się z cron.database_name
+        op.execute(
+            f"-- w bazie cron.database_name: SELECT cron.schedule_in_database('{REFRESH_JOB}', '*/5 * * * *', "
+            f"'{REFRESH_SQL}', '<baza aplikacji>')"
+        )
+        return
+    cron_db = cron_database()
+    if not cron_db:
+        # pg_cron włącza administrator serwera (na Azure: azure.extensions + shared_preload_libraries)
+        raise RuntimeError(
+            "pg_cron is not loaded, so mv_orders_daily would never be refreshed. Enable pg_cron, "
+            f"or set MV_REFRESH_EXTERNAL=1 and run '{REFRESH_SQL}' every few minutes from an external scheduler"
+        )
+    # ten sam jobname nadpisuje istniejący job, więc ponowne uruchomienie jest bezpieczne
+    execute_in_cron_database(
+        cron_db,
+        "SELECT cron.schedule_in_database(:job, '*/5 * * * *', :sql, :db)",
+        {"job": REFRESH_JOB, "sql": REFRESH_SQL, "db": op.get_bind().execute(sa.text("SELECT current_database()")).scalar()},
+    )
+
+
+def downgrade() -> None:
+    cron_db = None if MV_REFRESH_EXTERNAL or op.get_context().as_sql else cron_database()
+    if cron_db:
+        execute_in_cron_database(
+            cron_db,
+            "SELECT cron.unschedule(jobid) FROM cron.job WHERE jobname = :job",
+            {"job": REFRESH_JOB},
+        )
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_orders_daily")
@@ -0,0 +1,30 @@
+"""częściowy indeks na order_event_log(timestamp) dla zdarzeń 'ready'
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+# CONCURRENTLY nie blokuje zapisów do order_event_log, ale nie może działać w transakcji
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_oel_ready_ts", "order_event_log", ["timestamp"],
+            postgresql_where=sa.text("event_type = 'ready'"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("idx_oel_ready_ts", table_name="order_event_log", postgresql_concurrently=True)
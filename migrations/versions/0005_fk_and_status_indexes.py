@@ -0,0 +1,35 @@
+"""indeksy na kluczach obcych i aktywnych statusach zamówień
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+# order_item(menu_item_id) i orders(created_at) są już w 0002
+# CONCURRENTLY nie blokuje zapisów do tabel, ale nie może działać w transakcji
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("idx_orderitem_order", "order_item", ["order_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("idx_oel_order", "order_event_log", ["order_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(
+            "idx_orders_active_status", "orders", ["status"],
+            postgresql_where=sa.text("status IN ('new', 'pending', 'in_progress')"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("idx_orders_active_status", table_name="orders", postgresql_concurrently=True)
+        op.drop_index("idx_oel_order", table_name="order_event_log", postgresql_concurrently=True)
+        op.drop_index("idx_orderitem_order", table_name="order_item", postgresql_concurrently=True)
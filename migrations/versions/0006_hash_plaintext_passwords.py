@@ -0,0 +1,41 @@
+"""argon2 dla haseł zapisanych jawnym tekstem w manager_user.password_hash
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-14
+
+"""
+from alembic import op
+from argon2 import PasswordHasher
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+# Parametry zamrożone na moment migracji; hasła z innymi parametrami main.py przehaszuje przy logowaniu
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+
+def upgrade() -> None:
+    if op.get_context().as_sql:
+        # hashe liczone w Pythonie - skrypt offline podbiłby wersję bez przehaszowania haseł
+        raise RuntimeError("0006 hashes passwords in Python and cannot run in --sql mode; run 'alembic upgrade head' online")
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, password_hash FROM manager_user "
+        "WHERE password_hash IS NOT NULL AND password_hash NOT LIKE '$argon2%'"
+    )).all()
+    for user_id, plaintext in rows:
+        conn.execute(
+            sa.text("UPDATE manager_user SET password_hash = :h WHERE id = :id"),
+            {"h": password_hasher.hash(plaintext), "id": user_id},
+        )
+
+
+def downgrade() -> None:
+    # jednokierunkowe - jawnych haseł nie da się odtworzyć
+    pass
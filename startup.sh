@@ -0,0 +1,13 @@
+#!/bin/sh
+# Start instancji (App Service: startup-command w workflow, Docker: CMD).
+# Migracje przed uvicornem - nowy kod jest już wdrożony, a DATABASE_URL nie wychodzi poza Azure.
+# Równoległe starty instancji serializuje advisory lock w migrations/env.py.
+set -e
+
+alembic upgrade head
+
+# Endpointy są async: 1 worker na rdzeń (WEB_CONCURRENCY nadpisuje).
+# Uwaga: workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) musi zmieścić się w max_connections Postgresa.
+exec uvicorn main:app --host 0.0.0.0 --port "${PORT:-8000}" \
+    --loop uvloop --http httptools \
+    --workers "${WEB_CONCURRENCY:-$(nproc)}" --limit-concurrency 200